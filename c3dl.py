@@ -14,20 +14,73 @@ Usage:
 """
 
 import argparse
-import difflib
+import asyncio
+import bisect
+import functools
+import html
+import importlib.util
+import io
+import json
+import math
+import os
+import queue
 import re
 import shutil
 import sys
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, Union
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 from filelock import FileLock
+from lxml import etree
+from rapidfuzz import fuzz, process
 from tqdm import tqdm
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+# Number of relive title pages fetched concurrently
+TITLE_FETCH_WORKERS = 16
+
+# Seconds a relive title scraped from its page is cached before it's looked up again
+TITLE_CACHE_TTL = 24 * 3600
+
+# Size of the HTTP connection pool (per host)
+HTTP_POOL_SIZE = 32
+
+USER_AGENT = "c3dl (+https://github.com/efnats/c3dl)"
+
+# Read size for downloads - large reads keep per-chunk Python overhead low
+CHUNK_SIZE = 1024**2
+
+# Chunks buffered between receiving and writing a download
+WRITE_QUEUE_DEPTH = 4
+
+# Files smaller than this are always downloaded over a single connection
+SEGMENTED_MIN_SIZE = 64 * 1024**2
+
+# File types counted as downloaded media
+MEDIA_EXTENSIONS = ('.mp4', '.webm', '.mp3', '.opus')
+
+# Patterns for filename sanitizing and title normalization
+INVALID_FS_CHARS = re.compile(r'[\/:*?"<>|]')
+CONGRESS_TAG = re.compile(r'\s*\(\d{2}c\d\)\s*', re.I)
+SEPARATORS = re.compile(r'[_\-–—]')
+SPECIAL_CHARS = re.compile(r'[^\w\s\u00C0-\u017F]')
+WHITESPACE = re.compile(r'\s+')
+
+# Patterns for scraping the relive pages
+RELIVE_LINK = re.compile(r'href\s*=\s*["\'][^"\']*/relive/(\d+)["\']', re.I)
+HTML_TITLE = re.compile(r'<title[^>]*>(.*?)</title>', re.I | re.S)
+
 
 class Colors:
     """ANSI color codes for terminal output"""
@@ -58,6 +111,24 @@ def print_separator():
     print(f"\n{Colors.DIM}{'─' * 50}{Colors.RESET}\n")
 
 
+def create_session() -> requests.Session:
+    """
+    Create an HTTP session with connection pooling.
+    
+    Reusing connections avoids a TCP/TLS handshake per request.
+    Adapter-level retries are disabled - retries are handled by download_file.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "User-Agent": USER_AGENT,
+        "Connection": "keep-alive",
+    })
+    return session
+
+
 @dataclass
 class Config:
     """Configuration container with dynamic URL generation"""
@@ -66,6 +137,10 @@ class Config:
     quality: str = "hd"
     wait_time: int = 120
     retries: int = 0
+    parallel: int = 3
+    streams: int = 4
+    session: requests.Session = field(default_factory=create_session, repr=False)
+    release_index: 'ReleaseIndex' = field(init=False, repr=False)
 
     # Quality presets: (feed_name, file_extension, description)
     QUALITY_PRESETS = {
@@ -77,6 +152,10 @@ class Config:
         "opus":  ("opus",   ".opus", "Opus audio"),
     }
 
+    def __post_init__(self):
+        # Kept across loop cycles, rescanned only when the releases directory changes
+        self.release_index = ReleaseIndex(self.releases_dir)
+
     @property
     def feed_name(self) -> str:
         return self.QUALITY_PRESETS[self.quality][0]
@@ -97,6 +176,10 @@ class Config:
     def relive_cdn_base(self) -> str:
         return f"https://cdn.c3voc.de/relive/{self.congress}"
 
+    @property
+    def relive_index_url(self) -> str:
+        return f"{self.relive_cdn_base}/index.json"
+
     @property
     def releases_rss_url(self) -> str:
         return f"https://media.ccc.de/c/{self.congress}/podcast/{self.feed_name}.xml"
@@ -109,6 +192,19 @@ class Config:
     def releases_dir(self) -> Path:
         return self.base_dir / self.congress / "releases"
 
+    @property
+    def cache_dir(self) -> Path:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        return Path(cache_home) / "c3dl" / self.congress
+
+    @property
+    def title_cache_file(self) -> Path:
+        return self.cache_dir / "titles.json"
+
+    @property
+    def feed_cache_file(self) -> Path:
+        return self.cache_dir / f"feed-{self.feed_name}.json"
+
     @property
     def lock_file(self) -> Path:
         return Path(f"/tmp/{self.congress}_downloader.lock")
@@ -128,7 +224,7 @@ def sanitize_filename(title: str, extension: str, max_bytes: int = 240) -> str:
     - Leaves room for extension
     """
     # Replace invalid filesystem characters
-    filename = re.sub(r'[\/:*?"<>|]', '_', title)
+    filename = INVALID_FS_CHARS.sub('_', title)
     
     # Calculate available bytes for the name (excluding extension)
     available_bytes = max_bytes - len(extension.encode('utf-8'))
@@ -146,6 +242,30 @@ def sanitize_filename(title: str, extension: str, max_bytes: int = 240) -> str:
     return filename + extension
 
 
+def load_json(path: Path) -> dict:
+    """Load a JSON cache file, returning an empty dict if missing or unreadable"""
+    try:
+        data = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_json(path: Path, data: dict):
+    """
+    Atomically write a JSON cache file.
+    
+    Failures are reported but not fatal - the cache is only an optimization.
+    """
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=1), encoding='utf-8')
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"{Colors.DIM}Could not write cache {path}: {e}{Colors.RESET}")
+
+
 def format_size(size_bytes: int) -> str:
     """Format bytes as human-readable string"""
     if size_bytes >= 1024**3:
@@ -158,6 +278,7 @@ def format_size(size_bytes: int) -> str:
         return f"{size_bytes} B"
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_title(filename: str) -> str:
     """
     Normalize a filename for comparison.
@@ -172,50 +293,154 @@ def normalize_title(filename: str) -> str:
     name = Path(filename).stem
     
     # Remove congress tags like (39c3), (38c3), etc.
-    name = re.sub(r'\s*\(\d{2}c\d\)\s*', '', name, flags=re.I)
+    name = CONGRESS_TAG.sub('', name)
     
     # Remove common separators and normalize
-    name = re.sub(r'[_\-–—]', ' ', name)
+    name = SEPARATORS.sub(' ', name)
     
     # Remove special characters but keep umlauts
-    name = re.sub(r'[^\w\s\u00C0-\u017F]', '', name)
+    name = SPECIAL_CHARS.sub('', name)
     
     # Normalize whitespace
-    name = ' '.join(name.split())
+    name = WHITESPACE.sub(' ', name)
     
     return name.lower().strip()
 
 
-def find_matching_release(relive_title: str, releases_dir: Path, threshold: float = 0.85) -> Optional[Path]:
+def scan_files(directory: Path, suffixes: tuple) -> list[os.DirEntry]:
+    """
+    List files in a directory whose name ends with one of the suffixes (case-insensitive).
+    
+    Uses a single directory read; DirEntry caches file type and stat results.
+    Returns an empty list if the directory doesn't exist.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return [e for e in it if e.is_file() and e.name.lower().endswith(suffixes)]
+    except FileNotFoundError:
+        return []
+
+
+@dataclass
+class LibrarySnapshot:
+    """
+    Files in the relive and releases directories, from one scan per directory.
+    
+    Taken once per download cycle and kept up to date as files are
+    downloaded, renamed and removed (including .part files left behind by
+    failed downloads), instead of re-globbing the directories.
+    """
+    relive_files: dict[str, os.stat_result]
+    release_files: dict[str, os.stat_result]
+    partial_files: list[Path]
+
+
+def scan_library(config: Config) -> LibrarySnapshot:
+    """Scan the relive and releases directories"""
+    snapshot = LibrarySnapshot(relive_files={}, release_files={}, partial_files=[])
+
+    for files, directory in [(snapshot.relive_files, config.relive_dir), (snapshot.release_files, config.releases_dir)]:
+        for entry in scan_files(directory, MEDIA_EXTENSIONS + ('.part',)):
+            if entry.name.lower().endswith('.part'):
+                snapshot.partial_files.append(Path(entry.path))
+            else:
+                files[entry.name] = entry.stat()
+
+    return snapshot
+
+
+class ReleaseIndex:
+    """
+    Normalized titles of the release files in a directory.
+    
+    The directory is only rescanned when its modification time changes,
+    so in loop mode idle cycles don't touch the release files at all.
+    """
+
+    def __init__(self, directory: Path):
+        self.dir = directory
+        self.mtime_ns: Optional[int] = None
+        self.entries: dict[str, Path] = {}
+        # (length, normalized title) sorted by length, for candidate prefiltering
+        self.by_length: list[tuple[int, str]] = []
+
+    def refresh(self) -> 'ReleaseIndex':
+        """Rescan the directory if it changed since the last scan"""
+        try:
+            mtime_ns = self.dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            self.mtime_ns = None
+            self.entries = {}
+            self.by_length = []
+            return self
+
+        if mtime_ns != self.mtime_ns:
+            # Read mtime before scanning, so changes during the scan trigger another rescan
+            self.entries = {normalize_title(e.name): Path(e.path) for e in scan_files(self.dir, MEDIA_EXTENSIONS)}
+            self.by_length = sorted((len(name), name) for name in self.entries)
+            self.mtime_ns = mtime_ns
+
+        return self
+
+    def candidates(self, normalized: str, threshold: float) -> list[str]:
+        """
+        Normalized titles whose length allows a similarity ratio >= threshold.
+        
+        The ratio is at most 2*min(a, b) / (a + b), so titles of very different
+        length can be skipped without scoring them.
+        """
+        length = len(normalized)
+        low = math.floor(length * threshold / (2 - threshold))
+        high = math.ceil(length * (2 - threshold) / threshold)
+        start = bisect.bisect_left(self.by_length, (low, ''))
+        end = bisect.bisect_right(self.by_length, (high, '\U0010ffff'))
+        return [name for _, name in self.by_length[start:end]]
+
+
+def find_matching_release(relive_title: str, releases: Union[Path, ReleaseIndex],
+                          threshold: float = 0.85) -> Optional[Path]:
     """
     Find a release file that matches a relive title.
     
+    releases is either the releases directory or a ReleaseIndex of it.
     Uses fuzzy matching to handle slight differences in naming.
     Returns the matching release path or None.
     """
-    if not releases_dir.exists():
-        return None
+    if isinstance(releases, Path):
+        releases = ReleaseIndex(releases)
+    releases.refresh()
     
     normalized_relive = normalize_title(relive_title)
     
-    for release_file in releases_dir.glob("*"):
-        if not release_file.is_file():
-            continue
-        if release_file.suffix.lower() not in ('.mp4', '.webm', '.mp3', '.opus'):
-            continue
-            
-        normalized_release = normalize_title(release_file.name)
-        
-        # Calculate similarity ratio
-        ratio = difflib.SequenceMatcher(None, normalized_relive, normalized_release).ratio()
-        
-        if ratio >= threshold:
-            return release_file
+    # Best match by similarity ratio (0-100)
+    candidates = releases.candidates(normalized_relive, threshold)
+    match = process.extractOne(normalized_relive, candidates, scorer=fuzz.ratio, score_cutoff=threshold * 100)
     
-    return None
+    return releases.entries[match[0]] if match else None
 
 
-def cleanup_relive_duplicates(config: Config) -> int:
+def match_releases(titles: list[str], releases: ReleaseIndex, threshold: float = 0.85) -> list[Optional[Path]]:
+    """
+    Find the matching release file for each of a list of titles.
+    
+    Scores all titles against all releases in a single (multithreaded)
+    rapidfuzz.process.cdist call instead of matching titles one by one.
+    Returns the best matching release path (or None) for each title.
+    """
+    releases.refresh()
+    names = list(releases.entries)
+    if not titles or not names:
+        return [None] * len(titles)
+
+    # Scores below the cutoff are reported as 0
+    queries = [normalize_title(title) for title in titles]
+    scores = process.cdist(queries, names, scorer=fuzz.ratio, score_cutoff=threshold * 100, workers=-1)
+    best = scores.argmax(axis=1)
+
+    return [releases.entries[names[j]] if scores[i, j] > 0 else None for i, j in enumerate(best)]
+
+
+def cleanup_relive_duplicates(config: Config, snapshot: LibrarySnapshot) -> int:
     """
     Remove relive files that have a corresponding release.
     
@@ -225,63 +450,61 @@ def cleanup_relive_duplicates(config: Config) -> int:
         return 0
     
     removed = 0
+    release_index = config.release_index.refresh()
     
-    for relive_file in list(config.relive_dir.glob("*.mp4")):
-        matching_release = find_matching_release(relive_file.name, config.releases_dir)
+    for name in [n for n in snapshot.relive_files if n.lower().endswith('.mp4')]:
+        matching_release = find_matching_release(name, release_index)
         
         if matching_release:
-            relive_size = relive_file.stat().st_size
-            print(f"  {Colors.DIM}Removing relive (release exists): {relive_file.name}{Colors.RESET}")
+            print(f"  {Colors.DIM}Removing relive (release exists): {name}{Colors.RESET}")
             print(f"  {Colors.DIM}  → Matched: {matching_release.name}{Colors.RESET}")
-            relive_file.unlink()
+            (config.relive_dir / name).unlink()
+            del snapshot.relive_files[name]
             removed += 1
     
     return removed
 
 
-def find_existing_by_title(title: str, directory: Path, extension: str, threshold: float = 0.85) -> Optional[Path]:
+def find_existing_by_title(title: str, directory: Path, files: dict, extension: str,
+                           threshold: float = 0.85) -> Optional[Path]:
     """
     Find an existing file in directory that matches the given title.
     
+    files are the names of the files in directory (see LibrarySnapshot).
     Uses fuzzy matching to handle slight differences in naming.
     Returns the matching file path or None.
     """
-    if not directory.exists():
-        return None
-    
     normalized_new = normalize_title(title)
     
-    for existing_file in directory.glob(f"*{extension}"):
-        if not existing_file.is_file():
+    for name in files:
+        if not name.endswith(extension):
             continue
         
-        normalized_existing = normalize_title(existing_file.name)
+        existing_file = directory / name
+        normalized_existing = normalize_title(name)
         
         # Check if one title starts with the other
         if normalized_new.startswith(normalized_existing) or normalized_existing.startswith(normalized_new):
             return existing_file
         
         # Fuzzy match
-        ratio = difflib.SequenceMatcher(None, normalized_new, normalized_existing).ratio()
+        ratio = fuzz.ratio(normalized_new, normalized_existing) / 100
         if ratio >= threshold:
             return existing_file
     
     return None
 
 
-def cleanup_directory_duplicates(directory: Path, extensions: tuple = ('.mp4', '.webm', '.mp3', '.opus')) -> int:
+def cleanup_directory_duplicates(directory: Path, media_files: dict) -> int:
     """
     Find and remove duplicate files in a directory.
     Keeps the file with the longer (more complete) title.
     
+    media_files are the media files in directory (see LibrarySnapshot);
+    removed files are deleted from it.
     Returns number of files removed.
     """
-    if not directory.exists():
-        return 0
-    
-    files = []
-    for ext in extensions:
-        files.extend(directory.glob(f"*{ext}"))
+    files = [directory / name for name in media_files]
     
     if not files:
         return 0
@@ -309,7 +532,7 @@ def cleanup_directory_duplicates(directory: Path, extensions: tuple = ('.mp4', '
                 continue
             
             # Fuzzy match
-            ratio = difflib.SequenceMatcher(None, norm1, norm2).ratio()
+            ratio = fuzz.ratio(norm1, norm2) / 100
             if ratio >= 0.85:
                 group.append(file2)
                 processed.add(file2)
@@ -323,6 +546,7 @@ def cleanup_directory_duplicates(directory: Path, extensions: tuple = ('.mp4', '
                 print(f"  {Colors.DIM}Removing duplicate: {to_remove.name}{Colors.RESET}")
                 print(f"  {Colors.DIM}  → Keeping: {keep.name}{Colors.RESET}")
                 to_remove.unlink()
+                del media_files[to_remove.name]
                 removed += 1
             
             processed.add(file1)
@@ -345,102 +569,400 @@ def truncate_for_display(text: str, max_width: int = 50) -> str:
     return text[:max_width - 3] + "..."
 
 
-def download_file(url: str, output_path: Path, description: str, expected_size: int = 0, max_retries: int = 1) -> bool:
+class RangeNotSupported(Exception):
+    """Raised when the server ignores a byte range request"""
+
+
+class DownloadCancelled(Exception):
+    """Raised inside a running download when stop_downloads is set"""
+
+
+# Set on Ctrl+C to stop downloads running in worker threads
+stop_downloads = threading.Event()
+
+
+def progress_bar(description: str, total: int, initial: int = 0, position: Optional[int] = None) -> tqdm:
+    """Create a download progress bar sized to the terminal"""
+    # Calculate display width for progress bar description
+    term_width = get_terminal_width()
+    # Leave room for: progress bar (~30), percentage (~7), size (~20), speed (~15)
+    desc_width = max(20, term_width - 75)
+    short_desc = truncate_for_display(description, desc_width)
+
+    return tqdm(
+        desc=short_desc,
+        total=total,
+        initial=initial,
+        unit='iB',
+        unit_scale=True,
+        unit_divisor=1024,
+        bar_format='{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt} [{rate_fmt}]',
+        ncols=term_width,
+        position=position,
+        leave=position is None
+    )
+
+
+def advise_sequential(fd: int):
+    """Hint the kernel that a file is written sequentially (no-op where unsupported)"""
+    if hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
+def drop_page_cache(fd: int):
+    """
+    Flush a finished download to disk and drop it from the page cache.
+    
+    Downloaded files aren't read back, so keeping them cached would only
+    evict other data. The fsync is needed because DONTNEED skips dirty pages.
+    """
+    os.fsync(fd)
+    if hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def get_ranged_size(session: requests.Session, url: str) -> int:
+    """
+    Get the size of a remote file if the server supports byte ranges.
+    
+    Returns 0 if the size is unknown or ranges are not supported.
+    """
+    r = session.head(url, timeout=30, allow_redirects=True)
+    if not r.ok or r.headers.get('Accept-Ranges', '').lower() != 'bytes':
+        return 0
+    return int(r.headers.get('Content-Length', 0))
+
+
+def segment_marker(part_path: Path) -> Path:
+    """Marker file present while a .part file is being filled out of order"""
+    return part_path.with_suffix(part_path.suffix + '.segmented')
+
+
+def download_segmented(session: requests.Session, url: str, part_path: Path, total_size: int,
+                       num_streams: int, pbar: tqdm):
+    """
+    Download a file as byte ranges fetched in parallel over num_streams connections.
+    
+    Each range is written at its offset into a preallocated .part file.
+    On failure the .part file is truncated to the contiguous prefix that was
+    completed, so it can be resumed by a regular single-stream download.
+    Raises RangeNotSupported if the server answers a range request with the full file.
+    """
+    segment_size = -(-total_size // num_streams)
+    segments = [(start, min(start + segment_size, total_size)) for start in range(0, total_size, segment_size)]
+    progress = [0] * len(segments)
+    lock = threading.Lock()
+    failed = threading.Event()
+
+    def fetch(index: int):
+        start, end = segments[index]
+        headers = {'Range': f'bytes={start}-{end - 1}'}
+        with session.get(url, stream=True, timeout=30, headers=headers) as r:
+            if r.status_code != 206:
+                r.raise_for_status()
+                raise RangeNotSupported(f"server ignored range request (HTTP {r.status_code})")
+            r.raw.decode_content = True
+            while chunk := r.raw.read(CHUNK_SIZE):
+                if failed.is_set():
+                    return
+                if stop_downloads.is_set():
+                    raise DownloadCancelled()
+                os.pwrite(fd, chunk, start + progress[index])
+                progress[index] += len(chunk)
+                with lock:
+                    pbar.update(len(chunk))
+        if progress[index] != end - start:
+            raise IOError(f"incomplete range {start}-{end - 1}: got {progress[index]} bytes")
+
+    # While the marker exists, the .part file size does not reflect the downloaded data
+    marker = segment_marker(part_path)
+    marker.touch()
+    fd = os.open(part_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            os.posix_fallocate(fd, 0, total_size)
+        except (AttributeError, OSError):
+            # Not available on this platform/filesystem
+            os.ftruncate(fd, total_size)
+
+        with ThreadPoolExecutor(max_workers=len(segments)) as executor:
+            futures = [executor.submit(fetch, i) for i in range(len(segments))]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                failed.set()
+                raise
+
+        drop_page_cache(fd)
+
+    except BaseException:
+        # Keep only the contiguous prefix so the download can be resumed
+        completed = 0
+        for (start, end), done in zip(segments, progress):
+            completed += done
+            if done < end - start:
+                break
+        os.ftruncate(fd, completed)
+        raise
+
+    finally:
+        os.close(fd)
+        marker.unlink()
+
+
+def write_fd(fd: int, data: bytes) -> int:
+    """Write all of data to a file descriptor, returns the number of bytes written"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+    return len(data)
+
+
+def write_behind(read: Callable[[], bytes], write: Callable[[bytes], int], pbar: tqdm):
+    """
+    Copy chunks from read() to write() until read() returns no data.
+    
+    Writing happens on a separate thread, so disk writes (which can block
+    under writeback pressure) overlap with receiving the next chunk.
+    At most WRITE_QUEUE_DEPTH chunks are buffered in between.
+    """
+    chunks = queue.Queue(maxsize=WRITE_QUEUE_DEPTH)
+    errors = []
+
+    def writer():
+        # Keep draining after an error so the reader never blocks on a full queue
+        while (chunk := chunks.get()) is not None:
+            if errors:
+                continue
+            try:
+                pbar.update(write(chunk))
+            except BaseException as e:
+                errors.append(e)
+
+    thread = threading.Thread(target=writer, daemon=True)
+    thread.start()
+    try:
+        while not errors and (chunk := read()):
+            if stop_downloads.is_set():
+                raise DownloadCancelled()
+            chunks.put(chunk)
+    finally:
+        chunks.put(None)
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+
+def download_stream(session: requests.Session, url: str, part_path: Path, description: str,
+                    position: Optional[int] = None, announce_resume: bool = True) -> int:
+    """
+    Download a file over a single connection into its .part file.
+    
+    Resumes from the end of an existing .part file if the server supports it.
+    Returns the total size of the file (0 if unknown).
+    """
+    # Check if we can resume a partial download
+    resume_pos = 0
+    headers = {}
+    mode = os.O_TRUNC
+    
+    if part_path.exists():
+        resume_pos = part_path.stat().st_size
+        headers['Range'] = f'bytes={resume_pos}-'
+        mode = os.O_APPEND
+    
+    with session.get(url, stream=True, timeout=30, headers=headers) as r:
+        # Check if server supports resume (206 Partial Content)
+        if r.status_code == 206:
+            # Resuming - get total size from Content-Range header
+            content_range = r.headers.get('Content-Range', '')
+            if '/' in content_range:
+                total_size = int(content_range.split('/')[-1])
+            else:
+                total_size = resume_pos + int(r.headers.get('content-length', 0))
+            
+            if announce_resume and resume_pos > 0:
+                tqdm.write(f"{Colors.CYAN}↻ Resuming from {format_size(resume_pos)}{Colors.RESET}")
+        elif r.status_code == 200:
+            # Server doesn't support resume or fresh download
+            total_size = int(r.headers.get('content-length', 0))
+            if resume_pos > 0:
+                # Server sent full file, start over
+                resume_pos = 0
+                mode = os.O_TRUNC
+        else:
+            r.raise_for_status()
+            total_size = 0
+
+        # Unbuffered writes - chunks are already large, a BufferedWriter would only add a copy
+        fd = os.open(part_path, os.O_WRONLY | os.O_CREAT | mode, 0o644)
+        try:
+            with progress_bar(description, total_size, resume_pos, position) as pbar:
+                advise_sequential(fd)
+                r.raw.decode_content = True
+                write_behind(lambda: r.raw.read(CHUNK_SIZE), lambda chunk: write_fd(fd, chunk), pbar)
+                drop_page_cache(fd)
+        finally:
+            os.close(fd)
+
+    return total_size
+
+
+def download_file(session: requests.Session, url: str, output_path: Path, description: str, expected_size: int = 0,
+                  max_retries: int = 1, position: Optional[int] = None, num_streams: int = 1) -> bool:
     """
     Download a file with progress bar, resume support, and retry logic.
     
     Downloads to a .part file first, then renames on success.
     Supports resuming partial downloads if server supports Range requests.
+    Large new downloads are split across num_streams parallel connections.
+    When running in parallel, position selects the progress bar line.
     Returns True on success, False on failure.
     """
     part_path = output_path.with_suffix(output_path.suffix + '.part')
     
     for attempt in range(max_retries):
         try:
-            # Check if we can resume a partial download
-            resume_pos = 0
-            headers = {}
-            mode = 'wb'
-            
-            if part_path.exists():
-                resume_pos = part_path.stat().st_size
-                headers['Range'] = f'bytes={resume_pos}-'
-                mode = 'ab'  # Append mode
-            
-            with requests.get(url, stream=True, timeout=30, headers=headers) as r:
-                # Check if server supports resume (206 Partial Content)
-                if r.status_code == 206:
-                    # Resuming - get total size from Content-Range header
-                    content_range = r.headers.get('Content-Range', '')
-                    if '/' in content_range:
-                        total_size = int(content_range.split('/')[-1])
-                    else:
-                        total_size = resume_pos + int(r.headers.get('content-length', 0))
-                    
-                    if attempt == 0 and resume_pos > 0:
-                        print(f"{Colors.CYAN}↻ Resuming from {format_size(resume_pos)}{Colors.RESET}")
-                elif r.status_code == 200:
-                    # Server doesn't support resume or fresh download
-                    total_size = int(r.headers.get('content-length', 0))
-                    if resume_pos > 0:
-                        # Server sent full file, start over
-                        resume_pos = 0
-                        mode = 'wb'
-                else:
-                    r.raise_for_status()
-                    total_size = 0
-
-                # Calculate display width for progress bar description
-                term_width = get_terminal_width()
-                # Leave room for: progress bar (~30), percentage (~7), size (~20), speed (~15)
-                desc_width = max(20, term_width - 75)
-                short_desc = truncate_for_display(description, desc_width)
-
-                with open(part_path, mode) as f, tqdm(
-                    desc=short_desc,
-                    total=total_size,
-                    initial=resume_pos,
-                    unit='iB',
-                    unit_scale=True,
-                    unit_divisor=1024,
-                    bar_format='{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt} [{rate_fmt}]',
-                    ncols=term_width
-                ) as pbar:
-                    for chunk in r.iter_content(chunk_size=8192):
-                        size = f.write(chunk)
-                        pbar.update(size)
+            # A segmented download was interrupted without cleanup - its size can't be trusted
+            marker = segment_marker(part_path)
+            if marker.exists():
+                tqdm.write(f"{Colors.YELLOW}⚠ Discarding interrupted segmented download: {description}{Colors.RESET}")
+                if part_path.exists():
+                    part_path.unlink()
+                marker.unlink()
+
+            # Fetch large new files over multiple connections
+            segmented = False
+            if num_streams > 1 and not part_path.exists():
+                total_size = get_ranged_size(session, url)
+                if total_size >= SEGMENTED_MIN_SIZE:
+                    try:
+                        with progress_bar(description, total_size, 0, position) as pbar:
+                            download_segmented(session, url, part_path, total_size, num_streams, pbar)
+                        segmented = True
+                    except RangeNotSupported:
+                        # Fall back to a single stream (resumes whatever was completed)
+                        pass
+
+            if not segmented:
+                total_size = download_stream(session, url, part_path, description, position, attempt == 0)
 
             # Verify downloaded size
             actual_size = part_path.stat().st_size
             check_size = expected_size if expected_size > 0 else total_size
             
             if check_size > 0 and actual_size < check_size * 0.99:
-                print(f"{Colors.RED}✗ Size mismatch: {format_size(actual_size)} / {format_size(check_size)}{Colors.RESET}")
+                tqdm.write(f"{Colors.RED}✗ Size mismatch: {format_size(actual_size)} / {format_size(check_size)}{Colors.RESET}")
                 # Don't delete part file - might be able to resume
                 continue  # Retry
 
             # Rename .part to final filename on success
-            part_path.rename(output_path)
-            print(f"{Colors.GREEN}✓ Downloaded{Colors.RESET}")
+            os.replace(part_path, output_path)
+            tqdm.write(f"{Colors.GREEN}✓ Downloaded: {description}{Colors.RESET}")
             return True
 
+        except DownloadCancelled:
+            raise
+
         except Exception as e:
             retry_msg = f" (attempt {attempt + 1}/{max_retries})" if attempt < max_retries - 1 else ""
-            print(f"{Colors.RED}✗ Failed{retry_msg}: {e}{Colors.RESET}")
+            tqdm.write(f"{Colors.RED}✗ Failed{retry_msg}: {description}: {e}{Colors.RESET}")
             
             if attempt < max_retries - 1:
                 # Wait before retry with exponential backoff
                 wait_time = 2 ** attempt * 5  # 5s, 10s, 20s
-                print(f"{Colors.YELLOW}  Retrying in {wait_time}s...{Colors.RESET}")
+                tqdm.write(f"{Colors.YELLOW}  Retrying in {wait_time}s...{Colors.RESET}")
                 time.sleep(wait_time)
     
     # All retries failed - keep .part file for future resume (if it exists)
     if part_path.exists():
-        print(f"{Colors.DIM}  Partial download kept for future resume{Colors.RESET}")
+        tqdm.write(f"{Colors.DIM}  Partial download kept for future resume{Colors.RESET}")
     return False
 
 
-def download_releases(config: Config) -> int:
+def download_all(config: Config, downloads: list, files: dict, partial_files: list[Path],
+                 label: Callable[[dict], str]) -> int:
+    """
+    Download a list of files, running up to config.parallel downloads at once.
+    
+    Each download gets its own progress bar line while it is running.
+    Completed files are added to files, and partial_files is updated with
+    the .part files left behind (see LibrarySnapshot).
+    Returns number of successfully downloaded files.
+    """
+    total = len(downloads)
+    workers = max(1, min(config.parallel, total))
+
+    # Free progress bar lines, handed out to running downloads
+    positions = queue.SimpleQueue()
+    for position in range(workers):
+        positions.put(position)
+
+    def run(index: int, dl: dict) -> bool:
+        position = positions.get()
+        part_path = dl['output_path'].with_suffix(dl['output_path'].suffix + '.part')
+        try:
+            tqdm.write(f"\n{Colors.BOLD}[{index}/{total}]{Colors.RESET} {label(dl)}")
+            if download_file(
+                config.session, dl['url'], dl['output_path'], dl['filename'], dl['size'],
+                config.retries + 1, position=position if workers > 1 else None,
+                num_streams=config.streams
+            ):
+                files[dl['filename']] = dl['output_path'].stat()
+                return True
+            return False
+        finally:
+            # Output paths are unique, so no other download touches this entry
+            if part_path.exists():
+                if part_path not in partial_files:
+                    partial_files.append(part_path)
+            elif part_path in partial_files:
+                partial_files.remove(part_path)
+            positions.put(position)
+
+    if workers == 1:
+        # Run in the calling thread, so Ctrl+C interrupts the download directly
+        return sum(run(index, dl) for index, dl in enumerate(downloads, 1))
+
+    stop_downloads.clear()
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        results = list(executor.map(run, range(1, total + 1), downloads))
+    except KeyboardInterrupt:
+        # Worker threads don't see Ctrl+C - tell them to stop and drop queued downloads
+        stop_downloads.set()
+        executor.shutdown(cancel_futures=True)
+        raise
+    finally:
+        executor.shutdown()
+
+    return sum(results)
+
+
+def parse_release_feed(content: bytes) -> list[tuple[str, str, int]]:
+    """
+    Parse a podcast RSS feed into (title, url, size) tuples.
+    
+    Items without a title or enclosure URL are skipped.
+    """
+    items = []
+
+    for _, item in etree.iterparse(io.BytesIO(content), tag='item'):
+        title = item.findtext('title')
+        enclosure = item.find('enclosure')
+
+        if title and enclosure is not None and enclosure.get('url'):
+            items.append((title.strip(), enclosure.get('url'), int(enclosure.get('length', 0))))
+
+        # Free the parsed item, we only need the extracted values
+        item.clear()
+
+    return items
+
+
+def download_releases(config: Config, snapshot: LibrarySnapshot) -> int:
     """
     Download finalized releases from media.ccc.de podcast feed
     
@@ -450,12 +972,26 @@ def download_releases(config: Config) -> int:
     downloaded = 0
 
     try:
-        response = requests.get(config.releases_rss_url, timeout=30)
+        # Ask for the feed only if it changed since the last complete cycle.
+        # The cached validators are ignored if the releases directory changed
+        # since then (e.g. files were removed), so missing files are noticed.
+        feed_cache = load_json(config.feed_cache_file)
+        releases_mtime_ns = config.releases_dir.stat().st_mtime_ns
+        headers = {}
+        if feed_cache.get('releases_mtime_ns') == releases_mtime_ns:
+            if feed_cache.get('etag'):
+                headers['If-None-Match'] = feed_cache['etag']
+            if feed_cache.get('last_modified'):
+                headers['If-Modified-Since'] = feed_cache['last_modified']
+
+        response = config.session.get(config.releases_rss_url, timeout=30, headers=headers)
+        if response.status_code == 304:
+            print(f"{Colors.GREEN}✓ Feed unchanged, all releases complete{Colors.RESET}")
+            return 0
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'xml')
 
         # Find all items in the podcast feed
-        items = soup.find_all('item')
+        items = parse_release_feed(response.content)
 
         if not items:
             print(f"{Colors.YELLOW}No releases found for {config.congress}{Colors.RESET}")
@@ -466,51 +1002,49 @@ def download_releases(config: Config) -> int:
         already_have = 0
         incomplete = 0
 
-        for item in items:
-            title_tag = item.find('title')
-            enclosure = item.find('enclosure')
-
-            if not title_tag or not enclosure:
-                continue
-
-            title = title_tag.text.strip()
-            url = enclosure.get('url')
-            size = int(enclosure.get('length', 0))
-
-            if not url:
-                continue
+        release_files = snapshot.release_files
+        # Filenames already handled - downloads run in parallel, so each file may only be queued once
+        seen = set()
 
+        for title, url, size in items:
             # Create safe filename from title (handles byte limits for UTF-8)
             filename = sanitize_filename(title, config.file_extension)
             output_path = config.releases_dir / filename
 
-            if output_path.exists():
+            if filename in seen:
+                continue
+            seen.add(filename)
+
+            if filename in release_files:
                 # Check file size matches expected size
-                actual_size = output_path.stat().st_size
+                actual_size = release_files[filename].st_size
                 if size > 0 and actual_size < size * 0.99:  # Allow 1% tolerance
                     # File is incomplete, delete and re-download
                     print(f"{Colors.YELLOW}⚠ Incomplete: {filename} ({format_size(actual_size)} / {format_size(size)}){Colors.RESET}")
                     output_path.unlink()
+                    del release_files[filename]
                     incomplete += 1
                 else:
                     already_have += 1
                     continue
             else:
                 # Check if a similar file exists (title might have been renamed upstream)
-                existing = find_existing_by_title(title, config.releases_dir, config.file_extension)
+                existing = find_existing_by_title(title, config.releases_dir, release_files, config.file_extension)
                 if existing:
                     # Check file size to make sure it's complete
-                    actual_size = existing.stat().st_size
+                    actual_size = release_files[existing.name].st_size
                     if size > 0 and actual_size < size * 0.99:
                         # Existing file is incomplete, delete and re-download with new name
                         print(f"{Colors.YELLOW}⚠ Incomplete (renamed): {existing.name}{Colors.RESET}")
                         existing.unlink()
+                        del release_files[existing.name]
                         incomplete += 1
                     elif len(filename) > len(existing.name):
                         # New title is longer/more complete - rename
                         print(f"{Colors.CYAN}↻ Renaming: {existing.name}{Colors.RESET}")
                         print(f"{Colors.CYAN}        → {filename}{Colors.RESET}")
                         existing.rename(output_path)
+                        release_files[filename] = release_files.pop(existing.name)
                         already_have += 1
                         continue
                     else:
@@ -520,7 +1054,7 @@ def download_releases(config: Config) -> int:
             
             # Check for existing .part file (can be resumed)
             part_path = output_path.with_suffix(output_path.suffix + '.part')
-            resumable = part_path.exists()
+            resumable = part_path in snapshot.partial_files
 
             downloads.append({
                 'title': title,
@@ -545,15 +1079,17 @@ def download_releases(config: Config) -> int:
             remaining_msg += f" {Colors.CYAN}({resumable_count} resumable){Colors.RESET}"
         print(f"  {Colors.CYAN}↓ Remaining:{Colors.RESET} {remaining_msg}")
 
-        if not downloads:
-            return 0
-
         # Download missing files
-        for i, dl in enumerate(downloads, 1):
-            print(f"\n{Colors.BOLD}[{i}/{len(downloads)}]{Colors.RESET} {dl['title']}")
-
-            if download_file(dl['url'], dl['output_path'], dl['filename'], dl['size'], config.retries + 1):
-                downloaded += 1
+        if downloads:
+            downloaded = download_all(config, downloads, release_files, snapshot.partial_files, lambda dl: dl['title'])
+
+        # Everything in this version of the feed is on disk - remember it
+        if downloaded == len(downloads):
+            save_json(config.feed_cache_file, {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'releases_mtime_ns': config.releases_dir.stat().st_mtime_ns,
+            })
 
     except Exception as e:
         print(f"{Colors.RED}Error fetching releases: {e}{Colors.RESET}")
@@ -561,7 +1097,7 @@ def download_releases(config: Config) -> int:
     return downloaded
 
 
-def download_relive(config: Config) -> int:
+def download_relive(config: Config, snapshot: LibrarySnapshot) -> int:
     """
     Download relive streams from streaming.media.ccc.de
     
@@ -572,17 +1108,11 @@ def download_relive(config: Config) -> int:
     downloaded = 0
 
     try:
-        response = requests.get(config.relive_base_url, timeout=30)
+        response = config.session.get(config.relive_base_url, timeout=30)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
 
         # Extract relive IDs from links
-        relive_ids = set()
-        for link in soup.find_all('a', href=True):
-            if '/relive/' in link['href']:
-                relive_id = link['href'].split('/')[-1]
-                if relive_id.isdigit():
-                    relive_ids.add(relive_id)
+        relive_ids = set(RELIVE_LINK.findall(response.text))
 
         if not relive_ids:
             print(f"{Colors.YELLOW}No relive streams found for {config.congress}{Colors.RESET}")
@@ -591,43 +1121,54 @@ def download_relive(config: Config) -> int:
         # Build list of downloads
         downloads = []
         already_have = 0
-        has_release = 0
+        release_index = config.release_index.refresh()
+        # Filenames already handled - downloads run in parallel, so each file may only be queued once
+        seen = set()
+
+        titles = fetch_relive_titles(config, relive_ids)
 
         for relive_id in sorted(relive_ids):
-            title = get_relive_title(config, relive_id)
+            title = titles.get(relive_id)
             if not title:
                 continue
 
             filename = sanitize_filename(title, ".mp4")
             output_path = config.relive_dir / filename
 
-            if output_path.exists():
+            if filename in seen:
+                continue
+            seen.add(filename)
+
+            if filename in snapshot.relive_files:
                 already_have += 1
                 continue
             
             # Check if a similar file exists (title might have been renamed)
-            existing = find_existing_by_title(title, config.relive_dir, ".mp4")
+            existing = find_existing_by_title(title, config.relive_dir, snapshot.relive_files, ".mp4")
             if existing:
                 if len(filename) > len(existing.name):
                     # New title is longer/more complete - rename
                     print(f"{Colors.CYAN}↻ Renaming: {existing.name}{Colors.RESET}")
                     print(f"{Colors.CYAN}        → {filename}{Colors.RESET}")
                     existing.rename(output_path)
+                    snapshot.relive_files[filename] = snapshot.relive_files.pop(existing.name)
                 already_have += 1
                 continue
 
-            # Check if release already exists for this talk
-            if find_matching_release(title, config.releases_dir):
-                has_release += 1
-                continue
-
             downloads.append({
                 'relive_id': relive_id,
                 'title': title,
+                'url': f"{config.relive_cdn_base}/{relive_id}/muxed.mp4",
                 'filename': filename,
                 'output_path': output_path,
+                'size': 0,
             })
 
+        # Skip talks that already have a release
+        matches = match_releases([dl['title'] for dl in downloads], release_index)
+        has_release = sum(1 for match in matches if match)
+        downloads = [dl for dl, match in zip(downloads, matches) if not match]
+
         # Print summary
         total = already_have + has_release + len(downloads)
         print(f"Found {Colors.BOLD}{total}{Colors.RESET} relive stream(s)")
@@ -640,12 +1181,10 @@ def download_relive(config: Config) -> int:
             return 0
 
         # Download missing files
-        for i, dl in enumerate(downloads, 1):
-            print(f"\n{Colors.BOLD}[{i}/{len(downloads)}] Relive #{dl['relive_id']}:{Colors.RESET} {dl['title']}")
-            
-            video_url = f"{config.relive_cdn_base}/{dl['relive_id']}/muxed.mp4"
-            if download_file(video_url, dl['output_path'], dl['filename'], 0, config.retries + 1):
-                downloaded += 1
+        downloaded = download_all(
+            config, downloads, snapshot.relive_files, snapshot.partial_files,
+            lambda dl: f"{Colors.BOLD}Relive #{dl['relive_id']}:{Colors.RESET} {dl['title']}"
+        )
 
     except Exception as e:
         print(f"{Colors.RED}Error fetching relive streams: {e}{Colors.RESET}")
@@ -653,68 +1192,174 @@ def download_relive(config: Config) -> int:
     return downloaded
 
 
+def fetch_relive_titles(config: Config, relive_ids: set) -> dict[str, str]:
+    """
+    Get titles for relive streams.
+    
+    Titles are taken from the relive index.json on every call (one request
+    for all), so titles changed upstream are picked up and existing files
+    get renamed. IDs missing from the index are looked up on their relive
+    pages (concurrently, each is a separate request), using async httpx if
+    installed, otherwise a thread pool over the requests session. Those
+    scraped titles are kept in the on-disk title cache for TITLE_CACHE_TTL
+    seconds, so they aren't requested again every cycle.
+    Returns a dict of relive_id -> title for all IDs with a known title.
+    """
+    index = fetch_relive_index(config)
+    titles = {relive_id: index[relive_id] for relive_id in relive_ids if relive_id in index}
+
+    # Only scraped titles are cached; drop expired entries and IDs now in the index
+    now = time.time()
+    stored = load_json(config.title_cache_file)
+    cache = {
+        relive_id: entry for relive_id, entry in stored.items()
+        if relive_id not in index
+        and isinstance(entry, dict)
+        and isinstance(entry.get('title'), str)
+        and isinstance(entry.get('time'), (int, float))
+        and 0 <= now - entry['time'] < TITLE_CACHE_TTL
+    }
+    titles.update((relive_id, cache[relive_id]['title']) for relive_id in relive_ids if relive_id not in titles and relive_id in cache)
+    missing = sorted(relive_ids - titles.keys())
+
+    if missing:
+        if httpx:
+            fetched = asyncio.run(fetch_relive_titles_async(config, missing))
+        else:
+            with ThreadPoolExecutor(max_workers=TITLE_FETCH_WORKERS) as executor:
+                fetched = dict(zip(missing, executor.map(lambda rid: get_relive_title(config, rid), missing)))
+
+        for relive_id, title in fetched.items():
+            if title:
+                titles[relive_id] = title
+                cache[relive_id] = {'title': title, 'time': now}
+
+    if cache != stored:
+        save_json(config.title_cache_file, cache)
+
+    return titles
+
+
+def fetch_relive_index(config: Config) -> dict[str, str]:
+    """
+    Fetch the titles of all relive streams from the relive index.json.
+    
+    Returns a dict of relive_id -> title, or an empty dict if the index
+    isn't available.
+    """
+    try:
+        response = config.session.get(config.relive_index_url, timeout=30)
+        response.raise_for_status()
+        entries = response.json()
+    except (requests.RequestException, ValueError):
+        return {}
+
+    if not isinstance(entries, list):
+        return {}
+
+    titles = {}
+    for entry in entries:
+        if isinstance(entry, dict) and entry.get('id') is not None and isinstance(entry.get('title'), str):
+            # Relive pages are titled "Relive: <title> — <congress>"; clean up the index
+            # title in the same form so both sources yield the same title
+            title = clean_relive_title(f"{entry['title']} — {config.congress}")
+            # Blank titles are left out, so those IDs are scraped (and retried) instead
+            if title:
+                titles[str(entry['id'])] = title
+
+    return titles
+
+
+async def fetch_relive_titles_async(config: Config, relive_ids: list) -> dict[str, Optional[str]]:
+    """
+    Fetch titles for relive streams concurrently with httpx.
+    
+    Uses HTTP/2 if the h2 package is installed, so all requests share one connection.
+    """
+    limits = httpx.Limits(max_connections=HTTP_POOL_SIZE)
+    http2 = importlib.util.find_spec("h2") is not None
+
+    async with httpx.AsyncClient(http2=http2, limits=limits, timeout=30, headers={"User-Agent": USER_AGENT}) as client:
+
+        async def fetch(relive_id: str) -> Optional[str]:
+            try:
+                response = await client.get(f"{config.relive_base_url}/{relive_id}")
+                response.raise_for_status()
+                return parse_relive_title(response.text)
+            except httpx.HTTPError:
+                return None
+
+        titles = await asyncio.gather(*(fetch(relive_id) for relive_id in relive_ids))
+
+    return dict(zip(relive_ids, titles))
+
+
 def get_relive_title(config: Config, relive_id: str) -> Optional[str]:
     """Fetch and parse the title for a relive stream"""
     try:
         url = f"{config.relive_base_url}/{relive_id}"
-        response = requests.get(url, timeout=30)
+        response = config.session.get(url, timeout=30)
         response.raise_for_status()
+        return parse_relive_title(response.text)
 
-        soup = BeautifulSoup(response.text, 'html.parser')
-        title = soup.title.string if soup.title else None
-
-        if not title or "Relive:" not in title:
-            return None
+    except Exception:
+        return None
 
-        # Clean up: "Relive: Talk Title — 39C3" -> "Talk Title"
-        # Split on various dash types (em-dash, en-dash, regular)
-        for separator in [" — ", " – ", " - "]:
-            if separator in title:
-                title = title.split(separator)[0]
-                break
-        title = title.replace("Relive: ", "")
 
-        return title.strip()
+def parse_relive_title(page: str) -> Optional[str]:
+    """Extract the talk title from a relive page"""
+    match = HTML_TITLE.search(page)
+    title = html.unescape(match.group(1)) if match else None
 
-    except Exception:
+    if not title or "Relive:" not in title:
         return None
 
+    return clean_relive_title(title)
+
+
+def clean_relive_title(title: str) -> str:
+    """
+    Clean up a relive title: "Relive: Talk Title — 39C3" -> "Talk Title"
+    
+    Applied to titles from both the relive pages and index.json, so a talk
+    gets the same filename whichever source provided its title.
+    """
+    # Split on various dash types (em-dash, en-dash, regular)
+    for separator in [" — ", " – ", " - "]:
+        if separator in title:
+            title = title.split(separator)[0]
+            break
+    title = title.replace("Relive: ", "")
+
+    return title.strip()
 
-def cleanup_partial_downloads(config: Config) -> int:
+
+def cleanup_partial_downloads(snapshot: LibrarySnapshot) -> int:
     """Remove any leftover .part files from previous runs"""
     count = 0
-    for directory in [config.relive_dir, config.releases_dir]:
-        if directory.exists():
-            for part_file in directory.glob("*.part"):
-                size = part_file.stat().st_size
-                print(f"  {Colors.DIM}Removing: {part_file.name} ({format_size(size)}){Colors.RESET}")
-                part_file.unlink()
-                count += 1
+    for part_file in snapshot.partial_files:
+        size = part_file.stat().st_size
+        print(f"  {Colors.DIM}Removing: {part_file.name} ({format_size(size)}){Colors.RESET}")
+        part_file.unlink()
+        count += 1
+    snapshot.partial_files.clear()
     return count
 
 
-def count_partial_downloads(config: Config) -> int:
+def count_partial_downloads(snapshot: LibrarySnapshot) -> int:
     """Count .part files that can be resumed"""
-    count = 0
-    for directory in [config.relive_dir, config.releases_dir]:
-        if directory.exists():
-            count += len(list(directory.glob("*.part")))
-    return count
+    return len(snapshot.partial_files)
 
 
-def print_stats(config: Config):
+def print_stats(config: Config, snapshot: LibrarySnapshot):
     """Print download statistics for both directories"""
     print_separator()
     print(f"{Colors.BOLD}Statistics for {config.congress}{Colors.RESET}")
 
-    media_extensions = ("*.mp4", "*.webm", "*.mp3", "*.opus")
-
-    for name, directory in [("Relive", config.relive_dir), ("Releases", config.releases_dir)]:
+    for name, directory, files in [("Relive", config.relive_dir, snapshot.relive_files),
+                                   ("Releases", config.releases_dir, snapshot.release_files)]:
         if directory.exists():
-            files = []
-            for ext in media_extensions:
-                files.extend(directory.glob(ext))
-            total_size = sum(f.stat().st_size for f in files)
+            total_size = sum(st.st_size for st in files.values())
             print(f"{Colors.CYAN}{name}:{Colors.RESET}")
             print(f"  Files: {Colors.BOLD}{len(files)}{Colors.RESET}")
             print(f"  Size:  {Colors.BOLD}{format_size(total_size)}{Colors.RESET}")
@@ -831,36 +1476,54 @@ Note: Quality setting only applies to releases. Relive streams are always MP4.
         help="Number of retry attempts for failed downloads (default: 0)"
     )
 
+    parser.add_argument(
+        "-p", "--parallel",
+        type=int,
+        default=3,
+        metavar="N",
+        help="Number of files to download simultaneously (default: 3)"
+    )
+
+    parser.add_argument(
+        "--streams",
+        type=int,
+        default=4,
+        metavar="N",
+        help="Number of connections per large file (default: 4, 1 to disable)"
+    )
+
     return parser.parse_args()
 
 
-def run_download_cycle(config: Config, args: argparse.Namespace) -> int:
+def run_download_cycle(config: Config, args: argparse.Namespace, snapshot: LibrarySnapshot) -> int:
     """
     Run one download cycle.
     
+    snapshot must be taken at the start of the cycle; it is kept up to date
+    with all changes made during the cycle.
     Returns total number of new downloads.
     """
     total = 0
 
     # Clean up duplicates at the start of each cycle
     if not args.no_cleanup:
-        for name, directory in [("relive", config.relive_dir), ("releases", config.releases_dir)]:
-            if directory.exists():
-                cleaned = cleanup_directory_duplicates(directory)
-                if cleaned:
-                    print(f"{Colors.GREEN}Cleaned up {cleaned} duplicate(s) in {name}{Colors.RESET}")
+        for name, directory, files in [("relive", config.relive_dir, snapshot.relive_files),
+                                       ("releases", config.releases_dir, snapshot.release_files)]:
+            cleaned = cleanup_directory_duplicates(directory, files)
+            if cleaned:
+                print(f"{Colors.GREEN}Cleaned up {cleaned} duplicate(s) in {name}{Colors.RESET}")
 
     if not args.releases_only:
         print_separator()
-        total += download_relive(config)
+        total += download_relive(config, snapshot)
 
     if not args.relive_only:
         print_separator()
-        total += download_releases(config)
+        total += download_releases(config, snapshot)
         
         # Clean up relive files that now have releases (unless disabled)
         if not args.no_cleanup:
-            cleaned = cleanup_relive_duplicates(config)
+            cleaned = cleanup_relive_duplicates(config, snapshot)
             if cleaned:
                 print(f"{Colors.GREEN}Cleaned up {cleaned} relive duplicate(s){Colors.RESET}")
 
@@ -880,6 +1543,8 @@ def main():
         quality=args.quality,
         wait_time=args.wait_time,
         retries=args.retries,
+        parallel=max(1, args.parallel),
+        streams=max(1, args.streams),
     )
 
     print(f"{Colors.BOLD}{Colors.CYAN}c3dl{Colors.RESET} - CCC Media Downloader")
@@ -910,11 +1575,12 @@ def main():
 
     try:
         config.ensure_directories()
+        snapshot = scan_library(config)
         
         # Handle --clean-partial
         if args.clean_partial:
             print(f"{Colors.YELLOW}Cleaning up partial downloads...{Colors.RESET}")
-            cleaned = cleanup_partial_downloads(config)
+            cleaned = cleanup_partial_downloads(snapshot)
             if cleaned:
                 print(f"{Colors.GREEN}Removed {cleaned} partial download(s){Colors.RESET}")
             else:
@@ -922,28 +1588,30 @@ def main():
             return
         
         # Show count of resumable downloads
-        partial_count = count_partial_downloads(config)
+        partial_count = count_partial_downloads(snapshot)
         if partial_count:
             print(f"{Colors.CYAN}Found {partial_count} partial download(s) that can be resumed{Colors.RESET}")
 
         if args.once:
             # Single run mode
-            run_download_cycle(config, args)
-            print_stats(config)
+            run_download_cycle(config, args, snapshot)
+            print_stats(config, snapshot)
         else:
             # Loop mode
             print(f"{Colors.DIM}Running in loop mode (Ctrl+C to stop){Colors.RESET}")
 
             while True:
                 try:
-                    run_download_cycle(config, args)
-                    print_stats(config)
-
-                    print(f"{Colors.DIM}Waiting {config.wait_time} seconds...{Colors.RESET}")
-                    for remaining in range(config.wait_time, 0, -1):
-                        print(f"\r{Colors.DIM}Next check in {remaining:4d}s (Ctrl+C to stop){Colors.RESET}", end="")
-                        time.sleep(1)
-                    print("\n")
+                    run_download_cycle(config, args, snapshot)
+                    print_stats(config, snapshot)
+
+                    # Sleep in one go - Ctrl+C interrupts it immediately
+                    next_check = time.strftime("%H:%M:%S", time.localtime(time.time() + config.wait_time))
+                    print(f"{Colors.DIM}Waiting {config.wait_time} seconds, next check at {next_check} (Ctrl+C to stop){Colors.RESET}")
+                    time.sleep(config.wait_time)
+                    print()
+
+                    snapshot = scan_library(config)
 
                 except KeyboardInterrupt:
                     print(f"\n\n{Colors.YELLOW}Shutting down...{Colors.RESET}")